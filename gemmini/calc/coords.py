@@ -74,7 +74,7 @@ def outer_product(p:Tuple[float, float], q:Tuple[float, float], r:Tuple[float, f
         r (tuple, Optional): If a 3rd coordinates `r` is provided, 
             then it will return the outer product of two vectors: `p -> q` and `p -> r`.
     """
-    if type(r) == type(None):
+    if r is None:
         return p[0]*q[1] - q[0]*p[1]
 
     return (q[0] - p[0])*(r[1] - p[1]) - (r[0] - p[0])*(q[1] - p[1])
@@ -95,7 +95,10 @@ def to_cartesian(r:Union[float, np.ndarray], theta:Union[float, np.ndarray]) ->
     if isNumber(theta):
         xy = np.array([[r*cos(theta), r*sin(theta)]])
     elif isNumberArray(theta) :
-        xy = np.stack((r*np.cos(theta), r*np.sin(theta)), axis=1)
+        # write each column in place instead of stacking two temporaries
+        xy = np.empty((len(theta), 2))
+        np.multiply(r, np.cos(theta, out=xy[:, 0]), out=xy[:, 0])
+        np.multiply(r, np.sin(theta, out=xy[:, 1]), out=xy[:, 1])
     else :
         raise ValueError(" \
             [ERROR] to_cartesian: Both `radius` and `theta` should be a floating value, \
@@ -138,20 +141,10 @@ def bounding_box(xy:COORDINATES) -> Tuple[float, float, float, float]:
             [ERROR] bounding_box: Input array should be 2D or 3D point sets. \
         ")
     
-    if isinstance(xy, list):
-        lb, bb, rb, tb = inf, inf, -inf, -inf
-        
-        for p in xy:
-            lb = min(lb, p[0])
-            bb = min(bb, p[1])
-            rb = max(rb, p[0])
-            tb = max(tb, p[1])
-            
-        return lb, bb, rb, tb
-    else :
-        xs, ys = xy[:, 0], xy[:, 1]
+    xy = np.asarray(xy)[:, :2]
+    lo, hi = xy.min(axis=0), xy.max(axis=0)
 
-        return min(xs), min(ys), max(xs), max(ys)
+    return float(lo[0]), float(lo[1]), float(hi[0]), float(hi[1])
 
 
 def interior_pixels(xy:COORDINATES, density:float = 16) -> np.ndarray:
@@ -170,15 +163,14 @@ def interior_pixels(xy:COORDINATES, density:float = 16) -> np.ndarray:
         np.linspace(bb, tb, int((tb-bb)*density/min(rb-lb, tb-bb)))
     )
     
-    x, y = x.flatten(), y.flatten()
-    points = np.vstack((x, y)).T
+    points = np.column_stack((x.ravel(), y.ravel()))
     
-    p = pth.Path(border)
-    grid = p.contains_points(points)
-    idxs = np.where(grid == True)
-    inner_xy = points[idxs]
+    # boolean mask of grid pixels inside the border, used directly as an index
+    inner_xy = points[pth.Path(border).contains_points(points)]
     
-    res = np.concatenate((inner_xy, border), axis=0)
+    res = np.empty((len(inner_xy) + len(border), 2))
+    res[:len(inner_xy)] = inner_xy
+    res[len(inner_xy):] = border
     
     return res
 
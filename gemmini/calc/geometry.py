@@ -14,9 +14,16 @@ def connect_edges(*args:object) -> np.ndarray:
     Returns:
         xy (np.ndarray): (x, y) coordinates consisting of the resulted geometry.
     """
-    xy = [e[:-1] for e in args]
+    xy = [e.coords()[:-1] for e in args]
+    res = np.empty((sum(len(_c) for _c in xy), 2))
+    
+    i = 0
+    
+    for _c in xy:
+        res[i:i+len(_c)] = _c
+        i += len(_c)
 
-    return np.concatenate(tuple(xy), axis=0)
+    return res
 
 
 def convex_hull(xy:COORDINATES) -> np.ndarray:
@@ -78,33 +85,27 @@ def concave_hull(xy:COORDINATES, alpha:float = 0.9) -> np.ndarray:
         neighbors[i].append(j)
         neighbors[j].append(i)
 
-    for i, j, k in tri.simplices:
-        i, j, k = sorted([i, j, k])
-        pa = xy[i]
-        pb = xy[j]
-        pc = xy[k]
-
-        # Lengths of sides of triangle
-        a = dist(pa, pb)
-        b = dist(pb, pc)
-        c = dist(pa, pc)
+    # Side lengths, Heron's area and circumradius of every triangle at once
+    simplices = np.sort(tri.simplices, axis=1)
+    pts = np.asarray(xy, dtype=float)
+    pa, pb, pc = pts[simplices[:, 0]], pts[simplices[:, 1]], pts[simplices[:, 2]]
 
-        # Semiperimeter of triangle
-        s = (a + b + c)/2.0
+    a = np.linalg.norm(pa - pb, axis=1)
+    b = np.linalg.norm(pb - pc, axis=1)
+    c = np.linalg.norm(pa - pc, axis=1)
 
-        # Area of triangle by Heron's formula
-        area = sqrt(max(0, s*(s-a)*(s-b)*(s-c)))
-
-        if area == 0 :
-            continue
+    s = (a + b + c)/2.0
+    area = np.sqrt(np.maximum(0, s*(s-a)*(s-b)*(s-c)))
+    valid = area != 0
 
-        r = a*b*c/(4.0*area)
+    r = np.full(len(simplices), inf)
+    r[valid] = a[valid]*b[valid]*c[valid]/(4.0*area[valid])
 
-        # Here's the radius filter.
-        if r < scale/(alpha):
-            find_opp(opp, i, j, k)
-            find_opp(opp, j, k, i)
-            find_opp(opp, i, k, j)
+    # Here's the radius filter.
+    for i, j, k in simplices[r < scale/(alpha)].tolist():
+        find_opp(opp, i, j, k)
+        find_opp(opp, j, k, i)
+        find_opp(opp, i, k, j)
 
     for k,v in opp.items():
         if len(v) == 1:
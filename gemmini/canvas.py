@@ -127,11 +127,11 @@ class Canvas:
         self.draw_grid = draw_grid
         self.draw_major = major_ticks
         self.draw_minor = minor_ticks
-        self.gems = list()
+        self._scatter_gems, self._line_gems = [], []
 
         self.theme = THEMES.get(theme)
 
-        if type(self.theme) == type(None):
+        if self.theme is None:
             raise(" \
                 [ERROR] Canvas: Can't find a canvas theme named `%s`. \
                 "%(theme)
@@ -154,7 +154,7 @@ class Canvas:
     def _draw_figs(self) -> None:
         plt.rc('font', family='DejaVu Sans', size=self.fontsize)
         fig=plt.figure(figsize=self.window_size, facecolor=self.theme['facecolor'])
-        gem_configs = sorted(self.gems, key=lambda f: isinstance(f['fig'], Line2D))
+        gem_configs = self._gem_configs()
 
         ax, canvas_size = self._draw_ticks(fig, gem_configs)
 
@@ -330,31 +330,22 @@ class Canvas:
         )
 
     def _plot_edges(self, gem:Geometry2D, g_config:dict) -> None:
-        for edges in gem._outers:
-            for i in range(len(edges)-1):
+        for path in gem.exterior_coords() + gem.interior_coords():
+            for i in range(len(path)-1):
                 plt.plot(
-                    [gem[edges[i]][0], gem[edges[i+1]][0]], 
-                    [gem[edges[i]][1], gem[edges[i+1]][1]], 
-                    c=self.theme['edgecolor'],
-                    zorder = g_config['zorder']
-                )
-
-        for edges in gem._inners:
-            for i in range(len(edges)-1):
-                plt.plot(
-                    [gem[edges[i]][0], gem[edges[i+1]][0]], 
-                    [gem[edges[i]][1], gem[edges[i+1]][1]], 
+                    path[i:i+2, 0], 
+                    path[i:i+2, 1], 
                     c=self.theme['edgecolor'],
                     zorder = g_config['zorder']
                 )
 
     def _plot_interior(self, gem:Geometry2D, g_config:dict, ax:object, opaque:bool=False) -> None:
-        for edges in gem._outers:
+        for path in gem.exterior_coords():
             color = self.theme['edgecolor'] if opaque else g_config['opt_c']
             alpha = 0.5 if opaque else 1
 
             g = Polygon(
-                gem[edges],
+                path,
                 facecolor = color,
                 alpha = alpha,
                 zorder = g_config['zorder']
@@ -362,9 +353,9 @@ class Canvas:
 
             ax.add_patch(g)
 
-        for edges in gem._inners:
+        for path in gem.interior_coords():
             g = Polygon(
-                gem[edges],
+                path,
                 facecolor = self.theme['facecolor'],
                 zorder = g_config['zorder']
             )
@@ -565,7 +556,7 @@ class Canvas:
             'zorder':zorder + BASE_ORDER
         }
 
-        self.gems.append(fig_config)
+        self._scatter_gems.append(fig_config)
         
     def _add_gem(
         self, 
@@ -631,7 +622,7 @@ class Canvas:
             'zorder':zorder + BASE_ORDER
         }
 
-        self.gems.append(fig_config)
+        self._scatter_gems.append(fig_config)
 
     def _add_line(
         self, 
@@ -661,7 +652,7 @@ class Canvas:
             'zorder':zorder + BASE_ORDER
         }
 
-        self.gems.append(fig_config)
+        self._line_gems.append(fig_config)
 
     def add(
         self, 
@@ -717,25 +708,41 @@ class Canvas:
         Args:
             gem (Geometry2D | Line2D): figure to be removed.
         """
-        for i in range(len(self.gems)):
-            if hash(self.gems[i]['fig']) == hash(gem):
-                del self.gems[i]
-                return
+        for gems in (self._scatter_gems, self._line_gems):
+            for i in range(len(gems)):
+                if gems[i]['fig'] is gem:
+                    del gems[i]
+                    return
             
         warnings.warn(" \
             [WARN] Canvas: No such geometry exists on the figure list. \
         ")
             
+    def _gem_configs(self) -> list:
+        """
+        Return the reserved figures in drawing order (points/geometries first, lines last).
+        """
+        return list(itertools.chain(self._scatter_gems, self._line_gems))
+
     def __len__(self) -> int:
-        return len(self.gems)
+        return len(self._scatter_gems) + len(self._line_gems)
 
     def __getitem__(self, item:int) -> Geometry2D:
-        if len(self.gems) >= item:
+        if item >= len(self) or item < -len(self):
             raise IndexError(" \
                 [ERROR] Canvas: Index out of bound. \
             ")
 
-        return self.gems[item]['fig']
+        if item < 0:
+            item += len(self)
+
+        # points/geometries come first in drawing order, lines after them
+        ns = len(self._scatter_gems)
+
+        if item < ns:
+            return self._scatter_gems[item]['fig']
+
+        return self._line_gems[item - ns]['fig']
 
 
 def plot(gem:Any, **kwargs) -> None:
@@ -1,3 +1,6 @@
+from gemmini.d2._gem2D import (
+    batch_transform
+)
 from gemmini.d2.line2D import (
     Line2D,
     Segment
@@ -1,16 +1,117 @@
 
 from gemmini.misc import *
 from gemmini.d2.transform2D import *
-from gemmini.calc.coords import dist, outer_product
+from gemmini.calc.coords import dist
 
-import copy
-import random
+import functools
+
+# Rotation matrices are memoized per angle since the same angles are typically 
+# reused across many geometries (e.g. tiling or animating a scene). 
+# The cached arrays are shared, hence read-only.
+@functools.lru_cache(maxsize=256)
+def _rotate_matrix(a:float) -> np.ndarray:
+    m = affine_matrix(cos(a), -sin(a), sin(a), cos(a))
+    m.flags.writeable = False
+
+    return m
+
+
+@functools.lru_cache(maxsize=256)
+def _rotate3D_matrix(a1:float, a2:float, a3:float) -> np.ndarray:
+    m = affine_matrix(
+        cos(a1)*cos(a2), 
+        cos(a1)*sin(a2)*sin(a3) - sin(a1)*cos(a3),
+        sin(a1)*cos(a2), 
+        sin(a1)*sin(a2)*sin(a3) + cos(a1)*cos(a3)
+    )
+    m.flags.writeable = False
+
+    return m
+
+
+def _skew_matrix(a:float = None, ax:float = None, ay:float = None) -> np.ndarray:
+    if a is None and ax is None and ay is None:
+        raise ValueError(" \
+            [ERROR] skew: Missing argument `a` (angle) \
+        ")
+    
+    if a is not None:
+        ax = a
+        ay = a
+
+    tx = tan(ax) if ax is not None else 0
+    ty = tan(ay) if ay is not None else 0
+
+    return affine_matrix(1, tx, ty, 1)
+
+
+def _dot_matrix(m:np.ndarray) -> np.ndarray:
+    if m.shape != (2, 2):
+        raise ValueError(" \
+            [ERROR] dot: you should give (x, y) position/positions. \
+        ")
+
+    # (x, y) @ m is the linear map with matrix m.T
+    return affine_matrix(m[0, 0], m[1, 0], m[0, 1], m[1, 1])
+
+
+def _affine_of(m:np.ndarray) -> np.ndarray:
+    m = np.array(m, dtype=float)
+
+    if m.shape == (2, 3):
+        m = np.vstack((m, (0, 0, 1)))
+
+    if m.shape != (3, 3) or not np.array_equal(m[2], (0, 0, 1)):
+        raise ValueError(" \
+            [ERROR] apply_affine: the matrix should be a (2, 3) or (3, 3) affine matrix with last row (0, 0, 1). \
+        ")
+
+    return m
+
+
+# point-wise (non-affine) transformations, applied directly on the vertices
+_WARP_OPS = {
+    'distort': distort,
+    'focus': focus,
+    'shatter': shatter,
+}
+
+
+def _affine_inplace(pts:np.ndarray, m:np.ndarray) -> None:
+    """
+    Apply the 3 x 3 homogeneous matrix `m` to the (N, 2) float array `pts` in place.
+    """
+    if m[0, 1] == 0 and m[1, 0] == 0:
+        # axis-aligned (scale/flip): each contiguous column is scaled independently,
+        # and a column left unchanged by the map is not touched at all.
+        if m[0, 0] != 1:
+            pts[:, 0] *= m[0, 0]
+
+        if m[1, 1] != 1:
+            pts[:, 1] *= m[1, 1]
+    else :
+        np.matmul(pts, m[:2, :2].T, out=pts)
+
+    if m[0, 2] != 0:
+        pts[:, 0] += m[0, 2]
+
+    if m[1, 2] != 0:
+        pts[:, 1] += m[1, 2]
 
 
 def transform(func):
    def func_wrapper(self, *args, **kwargs):
-       self._base_hash += get_hash(*args, **kwargs)
-       func(self, *args, **kwargs)
+       m = func(self, *args, **kwargs)
+
+       # affine operations return their 3x3 matrix, which is composed lazily
+       # and applied to the vertices in a single pass by `_flush`.
+       if m is not None:
+           self._pending_affine = m if self._pending_affine is None else m @ self._pending_affine
+           self._carry_caches()
+       else :
+           self._cache.clear()
+
+   func_wrapper.is_transform = True
    return func_wrapper
 
 
@@ -25,7 +126,7 @@ class Geometry2D:
         It also includes a collection of transformation operations.
 
         All subclasses should overwrite 
-            1) `_base_coords`, a list of original (x, y) coordinates of vertices.
+            1) `_base_coords`, a float np.ndarray with shape (N, 2) holding the original (x, y) coordinates of vertices.
             2) `_linear_paths`, subsets of indexing numbers organized to indicate 
                 which vertex forms either the external boundary or a inner ring (also called `hole`).
             3) `__len__`, which is expected to return the diameter of the given geometry.
@@ -34,7 +135,8 @@ class Geometry2D:
             planar (bool): True, if the geometry has explicit boundary formed by its edges.
         """
         self._planar = planar
-        self._base_hash = random.getrandbits(128)
+        self._pending_affine = None
+        self._cache = {}
 
         for attr_name in ['uS', 'h', 'w']:
             if hasattr(self, attr_name) and getattr(self, attr_name) <= 0 :
@@ -46,8 +148,15 @@ class Geometry2D:
         self._points = self._base_coords()
         self._outers, self._inners = self._linear_paths()
 
-        if not isinstance(self._points, np.ndarray):
-            self._points = np.array(self._points)
+        # index paths are kept as integer arrays so that fancy indexing into 
+        # `_points` needs no list-to-array conversion on every call
+        self._outers = [np.ascontiguousarray(g, dtype=np.int32) for g in self._outers]
+        self._inners = [np.ascontiguousarray(g, dtype=np.int32) for g in self._inners]
+
+        # column-major storage keeps the x and y coordinates each contiguous,
+        # so per-axis reads and transforms stream through memory.
+        # The array is always an owned copy since transforms update it in place.
+        self._points = np.array(self._points, dtype=float, order='F')
         
         if len(self._points.shape) != 2 or self._points.shape[1] != 2 :
             raise ValueError(" \
@@ -68,7 +177,63 @@ class Geometry2D:
         """
         raise NotImplementedError
     
+    def _flush(self) -> None:
+        """
+        Apply the pending (composed) affine transformation to the vertices at once.
+        """
+        if self._pending_affine is None:
+            return
+        
+        _affine_inplace(self._points, self._pending_affine)
+        self._flushed()
+
+    def _flushed(self) -> None:
+        """
+        Clear the pending transformation once it has been applied to the vertices.
+        """
+        self._pending_affine = None
+        self._cache.pop('stored_bbox', None)
+
+        # a carried bounding box now describes the stored vertices themselves
+        if 'bounding_box' in self._cache:
+            self._cache['stored_bbox'] = self._cache['bounding_box']
+
+    def _warp(self, op:str, *args, **kwargs) -> None:
+        """
+        Apply a point-wise (non-affine) transformation on the vertices, 
+        keeping them as an owned, column-major float64 array.
+        """
+        self._flush()
+        self._points = np.asfortranarray(_WARP_OPS[op](self._points, *args, **kwargs), dtype=float)
+
+    def _carry_caches(self) -> None:
+        """
+        Keep the cached bounding box across an affine transformation, if it can be 
+        reproduced exactly; other cached values are dropped.
+
+        The box is mapped from the one of the stored (not yet transformed) vertices 
+        through the whole pending matrix, i.e. with the same arithmetic `_flush` applies 
+        to each vertex. For an axis-aligned map (scale/flip/translate) every step is 
+        monotonic, so the result equals the bounding box recomputed after the flush.
+        """
+        base = self._cache.get('stored_bbox')
+        self._cache = {}
+
+        if base is None:
+            return
+
+        self._cache['stored_bbox'] = base
+        m = self._pending_affine
+
+        if m[0, 1] == 0 and m[1, 0] == 0:
+            mx, my, Mx, My = base
+            xs = sorted((mx*m[0, 0] + m[0, 2], Mx*m[0, 0] + m[0, 2]))
+            ys = sorted((my*m[1, 1] + m[1, 2], My*m[1, 1] + m[1, 2]))
+            self._cache['bounding_box'] = (float(xs[0]), float(ys[0]), float(xs[1]), float(ys[1]))
+
     def _sub_figs(self, idx_groups:list) -> list:
+        self._flush()
+
         if len(idx_groups) == 0 :
             warnings.warn(" \
                 [WARN] %s class does not support segregating exterior (or interior) points. \
@@ -90,23 +255,73 @@ class Geometry2D:
         Return border of the geometric object.
         """
         return self._sub_figs(self._outers)
+    
+    def interior_coords(self) -> List[np.ndarray]:
+        """
+        Return the coordinates of each interior path as an (N, 2) array, 
+        without building `Sequence` objects.
+        """
+        self._flush()
+
+        return [self._points[_grp] for _grp in self._inners]
+    
+    def exterior_coords(self) -> List[np.ndarray]:
+        """
+        Return the coordinates of each exterior path as an (N, 2) array, 
+        without building `Sequence` objects.
+        """
+        self._flush()
+
+        return [self._points[_grp] for _grp in self._outers]
 
     def coords(self) -> np.ndarray:
         """
         Returns a list of (x, y) coordinates for the pixels (exterior only).
         """
+        self._flush()
+
         return self._points
 
     def coordsXY(self) -> np.ndarray:
         """
         Returns a list of coordinates for each axis.
         """
+        self._flush()
+
         return self._points[:, 0], self._points[:, 1]
     
+    def _edge_table(self) -> Tuple[np.ndarray, ...]:
+        """
+        Returns the line-independent terms of every edge (a, b) of the closed vertex path:
+        the differences a-b per axis, their lengths, the cross products a x b, and 
+        the lower/upper corners of each edge's bounding box.
+
+        The table is memoized until the next transformation.
+        """
+        if 'edges' not in self._cache:
+            a = self.coords()
+            b = np.roll(a, -1, axis=0)
+
+            ex = a[:, 0] - b[:, 0]
+            ey = a[:, 1] - b[:, 1]
+
+            self._cache['edges'] = (
+                ex, 
+                ey, 
+                np.hypot(ex, ey),
+                a[:, 0]*b[:, 1] - a[:, 1]*b[:, 0],
+                np.minimum(a, b), 
+                np.maximum(a, b)
+            )
+
+        return self._cache['edges']
+
     def coordSet(self) -> Tuple[Any, Any]:
         """
         Returns the x,y coordinates of its exterior/interior.
         """
+        self._flush()
+
         _e = [tuple(map(tuple, self._points[_grp])) for _grp in self._outers]
         _i = [tuple(map(tuple, self._points[_grp])) for _grp in self._inners]
 
@@ -123,8 +338,18 @@ class Geometry2D:
     def copy(self) -> object:
         """
         Return a copy of the given geometric object.
+
+        Only array attributes are duplicated; the others (shape parameters, 
+        the `_outers`/`_inners` index arrays built by `_linear_paths`) are shared 
+        since they are never modified after construction.
         """
-        gem = copy.deepcopy(self)
+        gem = object.__new__(type(self))
+        gem.__dict__ = {
+            k: v.copy(order='K') if isinstance(v, np.ndarray) else v 
+            for k, v in self.__dict__.items()
+        }
+        gem._cache = dict(self._cache)
+
         return gem
 
     def bounding_box(self) -> Tuple[float, float, float, float]:
@@ -134,33 +359,43 @@ class Geometry2D:
         Returns:
             (x_min, y_min, x_max, y_max): the minimum/maximum position of x, y axes.
         """
-        xs, ys = self.coordsXY()
+        if 'bounding_box' not in self._cache:
+            pts = self.coords()
+            lo, hi = pts.min(axis=0), pts.max(axis=0)
+            self._cache['bounding_box'] = float(lo[0]), float(lo[1]), float(hi[0]), float(hi[1])
+            self._cache['stored_bbox'] = self._cache['bounding_box']
 
-        return min(xs), min(ys), max(xs), max(ys)
+        return self._cache['bounding_box']
 
     def center(self) -> Tuple[float, float]:
         """
         Returns The centroid of a geometric object.
         """
-        xs, ys = self.coordsXY()
+        if 'center' not in self._cache:
+            c = self.coords().mean(axis=0)
+            self._cache['center'] = float(c[0]), float(c[1])
 
-        return np.mean(xs), np.mean(ys)
+        return self._cache['center']
 
     def dim(self) -> Tuple[float, float]:
         """
         Returns the width and height.
         """
-        mx, my, Mx, My = self.bounding_box()
+        if 'dim' not in self._cache:
+            mx, my, Mx, My = self.bounding_box()
+            self._cache['dim'] = Mx-mx, My-my
 
-        return Mx-mx, My-my
+        return self._cache['dim']
 
     def rad(self) -> float:
         """
         Returns the diameter.
         """
-        mx, my, Mx, My = self.bounding_box()
+        if 'rad' not in self._cache:
+            mx, my, Mx, My = self.bounding_box()
+            self._cache['rad'] = dist((mx, my), (Mx, My))/2
 
-        return dist((mx, my), (Mx, My))/2
+        return self._cache['rad']
     
     @transform
     def scale(self, sx:float, sy:float = None) -> None:
@@ -171,7 +406,7 @@ class Geometry2D:
             sx (float): the scaling factor to apply on the x-coordinate.
             sy (float): the scaling factor to apply on the y-coordinate.
         """
-        self._points = scale(self._points, sx, sy)
+        return affine_matrix(sx, 0, 0, sx if sy is None else sy)
         
     @transform
     def scaleX(self, s:float = None, **kwargs) -> None:
@@ -181,9 +416,10 @@ class Geometry2D:
         Args:
             s | scale (float): the scaling factor to apply on the x-coordinate.
         """
-        s = assignArg("scaleX", [s], ['scale'], kwargs)
+        if kwargs or s is None:
+            s = assignArg("scaleX", [s], ['scale'], kwargs)
         
-        self._points = scaleX(self._points, s)
+        return affine_matrix(s, 0, 0, 1)
         
     @transform
     def scaleY(self, s:float = None, **kwargs) -> None:
@@ -193,9 +429,10 @@ class Geometry2D:
         Args:
             s | scale (float): the scaling factor to apply on the y-coordinate.
         """
-        s = assignArg("scaleY", [s], ['scale'], kwargs)
+        if kwargs or s is None:
+            s = assignArg("scaleY", [s], ['scale'], kwargs)
 
-        self._points = scaleY(self._points, s)
+        return affine_matrix(1, 0, 0, s)
         
     @transform
     def translate(self, mx:float, my:float) -> None:
@@ -206,7 +443,7 @@ class Geometry2D:
             mx (float): represents shift along x-axis.
             my (float): represents shift along y-axis.
         """
-        self._points = translate(self._points, mx, my)
+        return affine_matrix(1, 0, 0, 1, mx, my)
         
     @transform
     def translateX(self, mx:float) -> None:
@@ -216,7 +453,7 @@ class Geometry2D:
         Args:
             mx (float): represents shift along x-axis.
         """
-        self._points = translateX(self._points, mx)
+        return affine_matrix(1, 0, 0, 1, mx, 0)
         
     @transform
     def translateY(self, my:float) -> None:
@@ -226,7 +463,7 @@ class Geometry2D:
         Args:
             my (float): represents shift along y-axis.
         """ 
-        self._points = translateY(self._points, my)
+        return affine_matrix(1, 0, 0, 1, 0, my)
         
     @transform
     def rotate(self, a:float = None, **kwargs) -> None:
@@ -236,9 +473,10 @@ class Geometry2D:
         Args:
             a | angle (float): angle (in radian) of rotation.
         """
-        a = assignArg("rotate", [a], ['angle'], kwargs)
+        if kwargs or a is None:
+            a = assignArg("rotate", [a], ['angle'], kwargs)
         
-        self._points = rotate(self._points, a)
+        return _rotate_matrix(a)
         
     @transform
     def rotateX(self, a:float = None, **kwargs) -> None:
@@ -248,9 +486,10 @@ class Geometry2D:
         Args:
             a | angle (float): angle (in radian) of rotation.
         """
-        a = assignArg("rotateX", [a], ['angle'], kwargs)
+        if kwargs or a is None:
+            a = assignArg("rotateX", [a], ['angle'], kwargs)
 
-        self._points = rotateX(self._points, a)
+        return affine_matrix(1, 0, 0, cos(a))
         
     @transform
     def rotateY(self, a:float = None, **kwargs) -> None:
@@ -260,9 +499,10 @@ class Geometry2D:
         Args:
             a | angle (float): angle (in radian) of rotation.
         """
-        a = assignArg("rotateY", [a], ['angle'], kwargs)
+        if kwargs or a is None:
+            a = assignArg("rotateY", [a], ['angle'], kwargs)
         
-        self._points = rotateY(self._points, a)
+        return affine_matrix(cos(a), 0, 0, 1)
         
     @transform
     def rotateZ(self, a:float = None, **kwargs) -> None:
@@ -272,9 +512,10 @@ class Geometry2D:
         Args:
             a | angle (float): angle (in radian) of rotation.
         """
-        a = assignArg("rotateZ", [a], ['angle'], kwargs)
+        if kwargs or a is None:
+            a = assignArg("rotateZ", [a], ['angle'], kwargs)
         
-        self._points = rotateZ(self._points, a)
+        return _rotate_matrix(a)
         
     @transform
     def rotate3D(self, a1:float = None, a2:float = None, a3:float = None, **kwargs) -> None:
@@ -286,14 +527,15 @@ class Geometry2D:
             a2 | pitch (float): counterclockwise rotation about the y-axis.
             a3 | roll (float): counterclockwise rotation about the x-axis.
         """
-        a1, a2, a3 = assignArg(
-            "rotate3D", 
-            [a1, a2, a3], 
-            ['yaw', 'pitch', 'roll'], 
-            kwargs
-        )
+        if kwargs or a1 is None or a2 is None or a3 is None:
+            a1, a2, a3 = assignArg(
+                "rotate3D", 
+                [a1, a2, a3], 
+                ['yaw', 'pitch', 'roll'], 
+                kwargs
+            )
 
-        self._points = rotate3D(self._points, a1, a2, a3)
+        return _rotate3D_matrix(a1, a2, a3)
         
     @transform
     def skew(self, a:float = None, ax:float=None, ay:float=None, **kwargs) -> None:
@@ -309,7 +551,7 @@ class Geometry2D:
         if 'angle' in kwargs:
             a = kwargs['angle']
 
-        self._points = skew(self._points, a, ax, ay)
+        return _skew_matrix(a, ax, ay)
         
     @transform
     def skewX(self, a:float = None, **kwargs) -> None:
@@ -319,9 +561,10 @@ class Geometry2D:
         Args:
             a | angle (float): angle (in radian) to use to distort the figure along the x-axis.
         """
-        a = assignArg("skewX", [a], ['angle'], kwargs)
+        if kwargs or a is None:
+            a = assignArg("skewX", [a], ['angle'], kwargs)
         
-        self._points = skewX(self._points, a)
+        return affine_matrix(1, tan(a), 0, 1)
         
     @transform
     def skewY(self, a:float = None, **kwargs) -> None:
@@ -331,9 +574,10 @@ class Geometry2D:
         Args:
             a | angle (float): angle (in radian) to use to distort the figure along the y-axis.
         """
-        a = assignArg("skewY", [a], ['angle'], kwargs)
+        if kwargs or a is None:
+            a = assignArg("skewY", [a], ['angle'], kwargs)
         
-        self._points = skewY(self._points, a)
+        return affine_matrix(1, 0, tan(a), 1)
         
     @transform
     def flip(self, p:Tuple[float, float]) -> None:
@@ -343,35 +587,35 @@ class Geometry2D:
         Args:
             p (tuple): a point along which to flip over.
         """
-        self._points = flip(self._points, p)
+        return affine_matrix(-1, 0, 0, -1, 2*p[0], 2*p[1])
         
     @transform
     def flipX(self) -> None:
         """
         Flip about the x-axis.
         """
-        self._points = flipX(self._points)
+        return affine_matrix(1, 0, 0, -1)
         
     @transform
     def flipY(self) -> None:
         """
         Flip about the y-axis.
         """
-        self._points = flipY(self._points)
+        return affine_matrix(-1, 0, 0, 1)
         
     @transform
     def flipXY(self) -> None:
         """
         Flip about the origin (0, 0).
         """
-        self._points = flipXY(self._points)
+        return affine_matrix(-1, 0, 0, -1)
         
     @transform
     def flipDiagonal(self) -> None:
         """
         Flip about the line: y = x.
         """
-        self._points = flipDiagonal(self._points)
+        return affine_matrix(0, 1, 1, 0)
         
     @transform
     def dot(self, m:np.ndarray) -> None:
@@ -381,7 +625,42 @@ class Geometry2D:
         Args:
             m (np.ndarray): 2 x 2 matrix for the matrix multiplication.
         """
-        self._points = dot(self._points, m)
+        return _dot_matrix(m)
+        
+    @transform
+    def apply_affine(self, m:np.ndarray) -> None:
+        """
+        Apply an arbitrary affine map given as a homogeneous matrix.
+
+        Args:
+            m (np.ndarray): 3 x 3 matrix [[a, b, tx], [c, d, ty], [0, 0, 1]] (or its upper 2 x 3 block),
+                mapping (x, y) to (a*x + b*y + tx, c*x + d*y + ty).
+        """
+        return _affine_of(m)
+        
+    def apply(self, op:str, *args, **kwargs) -> None:
+        """
+        Apply the transformation method named `op`.
+        Arguments are resolved by the method of the same name, so its keyword aliases 
+        (e.g. `angle`, `scale`) are accepted as well.
+
+        Args:
+            op (str): name of the transformation, e.g. `rotate`, `translate` or `distort`.
+            *args, **kwargs: arguments of the transformation.
+        """
+        if not getattr(getattr(Geometry2D, op, None), 'is_transform', False):
+            raise ValueError(" \
+                [ERROR] apply: `%s` is not a supported transformation. \
+                "%(op)
+            )
+        
+        try:
+            getattr(self, op)(*args, **kwargs)
+        except TypeError as e:
+            raise ValueError(" \
+                [ERROR] apply: Invalid arguments for `%s` (%s). \
+                "%(op, e)
+            ) from e
         
     @transform
     def distort(self, method='barrel', rate:float = 0.5) -> None:
@@ -394,7 +673,7 @@ class Geometry2D:
                 - pincushion: magnification increases with the distance from the optical axis.
             rate (float) : distortion coefficients.
         """
-        self._points = distort(self._points, method, rate)
+        self._warp('distort', method, rate)
         
     @transform
     def focus(self, p:Tuple[float, float], rate:float = 0.5) -> None:
@@ -405,7 +684,7 @@ class Geometry2D:
             p (float, float): (x, y) positions of pivot point.
             rate (float) : distortion factor to apply.
         """
-        self._points = focus(self._points, p, rate)
+        self._warp('focus', p, rate)
         
     @transform
     def shatter(self, p:Tuple[float, float], rate:float = 0.5) -> None:
@@ -416,19 +695,17 @@ class Geometry2D:
             p (float, float): (x, y) positions of pivot point.
             rate (float) : distortion factor to apply.
         """
-        self._points = shatter(self._points, p, rate)
+        self._warp('shatter', p, rate)
 
     def _partial_area(self, indices):
-        s = 0
-
-        for i in range(1, len(indices)-2):
-            pa = self._points[indices[0]]
-            pb = self._points[indices[i]]
-            pc = self._points[indices[i+1]]
+        self._flush()
 
-            s += outer_product(pa, pb, pc)/2
+        # shoelace formula over the ring (its closing vertex repeats the first one)
+        xy = self._points[indices[:-1]]
+        x, y = xy[:, 0], xy[:, 1]
+        s = x @ np.roll(y, -1) - y @ np.roll(x, -1)
 
-        return abs(s)
+        return abs(float(s))/2
 
     def area(self) -> float:
         """
@@ -442,15 +719,18 @@ class Geometry2D:
             
             return 0
         
-        res = 0
+        if 'area' not in self._cache:
+            res = 0
 
-        for indices in self._outers:
-            res += self._partial_area(indices)
-        
-        for indices in self._inners:
-            res -= self._partial_area(indices)
+            for indices in self._outers:
+                res += self._partial_area(indices)
             
-        return res
+            for indices in self._inners:
+                res -= self._partial_area(indices)
+
+            self._cache['area'] = res
+            
+        return self._cache['area']
 
     def __len__(self) -> int:
         """
@@ -459,8 +739,19 @@ class Geometry2D:
         raise NotImplementedError
 
     def __getitem__(self, item:int) -> Tuple[Any, Any]:
+        self._flush()
+
+        if isinstance(item, (int, np.integer)):
+            row = self._points[item]
+            return float(row[0]), float(row[1])
+
         return self._points[item].tolist()
     
+    def __iter__(self):
+        self._flush()
+
+        return map(tuple, self._points.tolist())
+    
     def __bool__(self) -> bool:
         return len(self._points) > 0
     
@@ -483,13 +774,28 @@ class Geometry2D:
         if not isinstance(other, Geometry2D):
             return False
 
-        return type(other) == type(self) and np.array_equal(self.exterior(), other.exterior())
+        if type(other) != type(self):
+            return False
+
+        if self._points.shape != other._points.shape:
+            return False
+
+        # cheap rejection first: content hashes, only if both are already known
+        if 'hash' in self._cache and 'hash' in other._cache and self._cache['hash'] != other._cache['hash']:
+            return False
+
+        return np.array_equal(self.coords(), other.coords())
 
     def __ne__(self, other) -> bool:
         return not self.__eq__(other)
     
     def __hash__(self) -> int:
-        return self._base_hash
+        # hash of the vertex buffer, computed once per state of the geometry
+        # (adding 0.0 maps -0.0 to 0.0, so equal coordinates give equal bytes)
+        if 'hash' not in self._cache:
+            self._cache['hash'] = hash((self.coords() + 0.0).tobytes(order='A'))
+
+        return self._cache['hash']
     
     
 class Sequence(Geometry2D):
@@ -506,14 +812,16 @@ class Sequence(Geometry2D):
         Args:
             points (list): set of cartesian coordinates (x, y).
         """
-        self.points = np.array(points)
+        self.points = np.array(points, dtype=float)
         
         if len(self.points.shape) != 2 or self.points.shape[1] != 2 :
             raise ValueError(" \
                 [ERROR] Sequence: Input matrix does not match the format of 2D-point set. \
             ")
         
-        self.closed = isSame(self.points[0], self.points[-1])
+        # same 1e-6 tolerance as `isSame`, compared on the float rows directly
+        self.closed = bool((np.abs(self.points[0] - self.points[-1]) <= 1e-6).all())
+        self._len = len(self.points) - int(self.closed)
         
         super().__init__(
             planar=self.closed,
@@ -533,12 +841,71 @@ class Sequence(Geometry2D):
         return [linear_ring(len(self))], []
 
     def __len__(self) -> int:
-        return len(self.points) - int(self.closed)
+        return self._len
     
     def __hash__(self) -> int:
         return super().__hash__()
 
 
+# geometries with at most this many vertices are stacked by `batch_transform`
+_BATCH_ROWS = 64
+
+
+def batch_transform(figures:Tuple[Geometry2D, ...], op:Union[str, np.ndarray], *args, **kwargs) -> None:
+    """
+    Apply the same transformation to several geometries at once.
+    The (lazily composed) affine maps of small figures are grouped by matrix, 
+    and each group is flushed with a single matrix product over the stacked vertices;
+    figures with more than `_BATCH_ROWS` vertices are flushed one by one, in place.
+
+    Args:
+        figures (tuple): geometries to be transformed.
+        op (str | np.ndarray): name of the transformation method, e.g. `rotate`, `translate`,
+            or a 3 x 3 (or 2 x 3) affine matrix, same with `op='apply_affine'`.
+        *args, **kwargs: arguments forwarded to the transformation.
+    """
+    if not isinstance(op, str):
+        op, args = 'apply_affine', (op,) + args
+
+    if not getattr(getattr(Geometry2D, op, None), 'is_transform', False):
+        raise ValueError(" \
+            [ERROR] batch_transform: `%s` is not a transformation of Geometry2D. \
+            "%(op)
+        )
+
+    groups = {}
+
+    for f in figures:
+        getattr(f, op)(*args, **kwargs)
+
+        if f._pending_affine is None:
+            continue
+
+        # stacking costs three copies of the vertices, which only pays off against 
+        # the per-call overhead of small geometries; larger ones are flushed in place
+        if len(f._points) > _BATCH_ROWS:
+            f._flush()
+        else :
+            groups.setdefault(f._pending_affine.tobytes(), []).append(f)
+
+    for gems in groups.values():
+        if len(gems) == 1:
+            gems[0]._flush()
+            continue
+
+        # same kernel as `_flush`, so the result does not depend on the batching
+        pts = np.asfortranarray(np.concatenate([f._points for f in gems], axis=0))
+        _affine_inplace(pts, gems[0]._pending_affine)
+
+        i = 0
+
+        for f in gems:
+            n = len(f._points)
+            f._points[:] = pts[i:i+n]
+            f._flushed()
+            i += n
+
+
 def union(figures=Tuple[Geometry2D, ...], density:int = 16, **kwargs) -> Geometry2D:
     raise NotImplementedError(" \
         [ERROR] union: Tried to call a function unsupported, but it will be updated soon. \
@@ -1,6 +1,9 @@
 from gemmini.misc import *
 from gemmini.d2._gem2D import Geometry2D
 
+# absolute tolerance for float comparisons between gradients/positions
+_EPS = 1e-12
+
 
 class Line2D:
     def __init__(
@@ -17,17 +20,17 @@ class Line2D:
             p1, p2 (tuple): Points for the line to pass through.
             slope (float): The slope of the line.
         """
-        if (type(p2) == type(None) and slope == None) or (type(p2) != type(None) and slope != None):
+        if (p2 is None and slope is None) or (p2 is not None and slope is not None):
             raise ValueError(" \
                 [ERROR] Line2D: Either p2 or slope has to be given. \
             ")
         
-        if not isPoint(p1, dim=2) or (type(p2) != type(None) and not isPoint(p2, dim=2)):
+        if not isPoint(p1, dim=2) or (p2 is not None and not isPoint(p2, dim=2)):
             raise ValueError(" \
                 [ERROR] Line2D: Input vector does not match the format of 2D point. \
             ")
         
-        if slope != None and not isNumber(slope):
+        if slope is not None and not isNumber(slope):
             raise ValueError(" \
                 [ERROR] Line2D: Tried to assign non-numetic value to `slope`. \
             ")
@@ -36,48 +39,63 @@ class Line2D:
         self.p2 = p2
         self.slope = slope
 
+        # the gradient is fixed at construction; `inf` marks a vertical line
+        if slope is not None:
+            self._m = slope
+        elif abs(p2[0] - p1[0]) < _EPS:
+            self._m = inf
+        else :
+            self._m = (p2[1]-p1[1])/(p2[0]-p1[0])
+
+        # two distinct points on the line, as plain floats, for the intersection math
+        x1, y1 = float(p1[0]), float(p1[1])
+
+        if p2 is not None:
+            self._ends = ((x1, y1), (float(p2[0]), float(p2[1])))
+        elif self._m == inf:
+            self._ends = ((x1, y1), (x1, y1 + 1))
+        else :
+            self._ends = ((x1, y1), (x1 + 1, y1 + self._m))
+
+        # unit direction vector, used to project points onto the line
+        (x2, y2) = self._ends[1]
+        _n = sqrt((x2 - x1)**2 + (y2 - y1)**2)
+        self._dir = ((x2 - x1)/_n, (y2 - y1)/_n) if _n > 0 else (0.0, 1.0)
+
+        # canonical key for __eq__/__hash__, built on first use
+        self._key = None
+
     def grad(self) -> float:
         """
         Return the gradient of the line.
         """
-        if self.slope != None:
-            return self.slope
-
-        if self.p1[0] == self.p2[0]:
-            return inf
-
-        return (self.p2[1]-self.p1[1])/(self.p2[0]-self.p1[0])
+        return self._m
     
     def parallel(self, other:Any) -> bool:
         """
         True, if two line are parallel.
         """
-        if type(other) != Line2D:
+        if type(other) is not Line2D:
             raise ValueError(" \
                 [ERROR] parallel: the input is not a `Line2D` object. \
             ")
 
-        return self.grad() == other.grad()
+        (ax, ay), (bx, by) = self._dir, other._dir
+
+        return abs(ax*by - ay*bx) <= _EPS
     
     def orthog(self, other:Any) -> bool:
         """
         True, if two line are orthogonal.
         """
-        if type(other) != Line2D:
+        if type(other) is not Line2D:
             raise ValueError(" \
                 [ERROR] orthognal: the input is not a `Line2D` object. \
             ")
 
-        ga = self.grad()
-        gb = other.grad()
+        (ax, ay), (bx, by) = self._dir, other._dir
 
-        if (ga == inf and gb == 0) or (ga == 0 and gb == inf):
-            return True
-        
-        if ga*gb == -1:
-            return True
- 
-        return False
+        return abs(ax*bx + ay*by) <= _EPS
     
     def orthog_point(self, p:Tuple[float, float]) -> Tuple[float, float]:
         """
@@ -87,18 +105,27 @@ class Line2D:
         Args:
             p (tuple): a (x, y) coordinates.
         """
-        g = self.grad()
+        (x1, y1), _ = self._ends
+        dx, dy = self._dir
 
-        if g == 0 :
-            return p[0], self.p1[1]
-        
-        if g == inf:
-            return self.p1[0], p[1]
-        
-        x = (p[0]/g + g*self.p1[0] + p[1] - self.p1[1])*g/(g**2 + 1)
-        y = g*(x - self.p1[0]) + self.p1[1]
+        t = (p[0] - x1)*dx + (p[1] - y1)*dy
 
-        return x, y
+        return x1 + t*dx, y1 + t*dy
+    
+    def orthog_points(self, points:COORDINATES) -> np.ndarray:
+        """
+        Return the feet of perpendiculars for multiple points at once.
+
+        Args:
+            points (list | np.ndarray): (x, y) coordinates, in shape of (N, 2).
+        """
+        xy = np.asarray(points, dtype=float)
+        p1 = np.asarray(self._ends[0])
+        d = np.asarray(self._dir)
+
+        t = (xy - p1) @ d
+
+        return p1 + np.multiply.outer(t, d)
     
     def _intersect_line(self, other:Any) -> Tuple[float, float]:
         if self.parallel(other):
@@ -108,60 +135,75 @@ class Line2D:
             
             return None, None
         
-        ga = self.grad()
-        gb = other.grad()
-
-        if ga == inf:
-            rx = self.p1[0]
-            ry = gb*(rx - other.p1[0]) + other.p1[1]
-        elif gb == inf:
-            rx = other.p1[0]
-            ry = ga*(rx - self.p1[0]) + self.p1[1]
-        else :
-            rx = (ga*self.p1[0] - gb*other.p1[0] - self.p1[1] + other.p1[1])/(ga-gb)
-            ry = ga*(rx - self.p1[0]) + self.p1[1]
+        # determinant form over two points of each line
+        (x1, y1), (x2, y2) = self._ends
+        (x3, y3), (x4, y4) = other._ends
+
+        d = (x1 - x2)*(y3 - y4) - (y1 - y2)*(x3 - x4)
+        a = x1*y2 - y1*x2
+        b = x3*y4 - y3*x4
+
+        rx = (a*(x3 - x4) - (x1 - x2)*b)/d
+        ry = (a*(y3 - y4) - (y1 - y2)*b)/d
 
         return rx, ry
     
-    def _intersect_segment(self, other:Any) -> Tuple[float, float]:
-        coord = other.coords()
-        _l = Line2D(coord[0], coord[-1])
+    def _edge_intersections(self, gem:Geometry2D) -> Tuple[np.ndarray, ...]:
+        """
+        Intersect the line with every edge of the geometry's closed vertex path at once.
 
-        _x, _y = self._intersect_line(_l)
+        Returns the x/y coordinates of the intersection point for each edge, 
+        a mask of edges parallel to the line, and a mask of edges actually hit.
+        """
+        ex, ey, el, v, lo, hi = gem._edge_table()
 
-        if _x == None:
-            return None, None
-        
-        if min(coord[0][0], coord[-1][0]) <= _x \
-        and max(coord[0][0], coord[-1][0]) >= _x \
-        and min(coord[0][1], coord[-1][1]) <= _y \
-        and max(coord[0][1], coord[-1][1]) >= _y:
-            return _x, _y
+        (x1, y1), (x2, y2) = self._ends
 
-        return None, None
-    
-    def _intersect_gem(self, other:Any) -> List[Tuple]:
-        res = []
+        # an edge is parallel when its cross product with the unit direction 
+        # vanishes (within `_EPS` per unit of edge length)
+        dx, dy = self._dir
+        parallel = np.abs(dx*ey - dy*ex) <= _EPS*el
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            d = (x1 - x2)*ey - (y1 - y2)*ex
+            parallel |= (d == 0)
+
+            u = x1*y2 - y1*x2
+
+            rx = (u*ex - (x1 - x2)*v)/d
+            ry = (u*ey - (y1 - y2)*v)/d
 
-        coord = other.coords()
-        idx = list(range(len(coord))) + [0]
+        # the bounds are widened by `_EPS` relative to the magnitude of the inputs,
+        # so that a crossing on an axis-aligned edge is not lost to rounding in rx/ry
+        scale = max(1.0, abs(x1), abs(y1), abs(x2), abs(y2))
+        tol = _EPS*np.maximum(scale, np.maximum(np.abs(lo), np.abs(hi)).max(axis=1))
 
-        for i in range(len(coord)):
-            _s = Segment(nD=2, p1=coord[idx[i]], p2=coord[idx[i+1]])
-            _x, _y = self._intersect_segment(_s)
+        # zero-length edges (repeated vertices) have no direction, so they 
+        # can neither be parallel to the line nor cross it
+        degenerate = el == 0
+        parallel &= ~degenerate
 
-            if _x == None:
-                continue
+        hit = ~parallel & ~degenerate \
+            & (lo[:, 0] - tol <= rx) & (hi[:, 0] + tol >= rx) \
+            & (lo[:, 1] - tol <= ry) & (hi[:, 1] + tol >= ry)
 
-            res.append([_x, _y])
+        return rx, ry, parallel, hit
+    
+    def _intersect_gem(self, other:Any) -> np.ndarray:
+        rx, ry, parallel, hit = self._edge_intersections(other)
+
+        if parallel.any():
+            warnings.warn(" \
+                [WARN] intersect: Two line are parallel. \
+            ")
 
-        return np.array(res)
+        return np.column_stack((rx[hit], ry[hit]))
     
     def intersect(self, other:Any) -> Tuple[float, float]:
         """
         Return the coordinates of intersection point with another line/geometry.
         """
-        if type(self) == type(other):
+        if type(self) is type(other):
             return self._intersect_line(other)
         
         if isinstance(other, Geometry2D):
@@ -179,42 +221,19 @@ class Line2D:
             other ((float, float) | Geometry2D]): can be either a (x, y) coordinates or geometric object.
         """
         if isPoint(other):
-            return other[1] == self.grad()*(other[0] - self.p1[0]) + self.p1[1]
+            (x1, y1), _ = self._ends
+            dx, dy = self._dir
+
+            return abs((other[1] - y1)*dx - (other[0] - x1)*dy) <= _EPS
         
         if not isinstance(other, Geometry2D):
             raise ValueError(" \
                 [ERROR] on: Input should be a 2D point or geometric object. \
             ")
 
-        coord = other.coords()
-        idx = list(range(len(coord))) + [0]
-
-        for i in range(len(coord)):
-            _l = Line2D(coord[idx[i]], coord[idx[i+1]])
-
-            if self.parallel(_l):
-                return True
-
-            _x, _y = self._intersect_line(_l)
-
-            if _x == None:
-                continue
+        _, _, parallel, hit = self._edge_intersections(other)
 
-            if min(coord[idx[i]][0], coord[idx[i+1]][0]) > _x :
-                continue
-
-            if max(coord[idx[i]][0], coord[idx[i+1]][0]) < _x:
-                continue
-
-            if min(coord[idx[i]][1], coord[idx[i+1]][1]) > _y :
-                continue
-
-            if max(coord[idx[i]][1], coord[idx[i+1]][1]) < _y:
-                continue
-
-            return True
-
-        return False        
+        return bool(parallel.any() or hit.any())
 
     def __and__(self, other:Any) -> Tuple[float, float]:
         return self.intersect(other)
@@ -222,17 +241,34 @@ class Line2D:
     def __str__(self) -> str:
         return 'Line2D'
     
+    def _line_key(self) -> Tuple[float, float, float]:
+        """
+        Canonical implicit form Ax + By + C = 0 with (A, B) a unit normal, 
+        sign-normalized and rounded, so equal lines share one key.
+        """
+        if self._key is None:
+            (x1, y1), _ = self._ends
+            A, B = -self._dir[1], self._dir[0]
+
+            if A < 0 or (A == 0 and B < 0):
+                A, B = -A, -B
+
+            C = -(A*x1 + B*y1)
+            self._key = (round(A, 10) + 0.0, round(B, 10) + 0.0, round(C, 10) + 0.0)
+
+        return self._key
+
     def __eq__(self, other:Any) -> bool:
         if not isinstance(other, Line2D):
             return False
 
-        return (self.grad() == other.grad() and other.on(self.p1))
+        return self._line_key() == other._line_key()
 
     def __ne__(self, other:Any) -> bool:
         return not self.__eq__(other)
     
     def __hash__(self) -> int:
-        return hash((self.p1, self.grad()))
+        return hash(self._line_key())
     
 
 class Segment(Geometry2D):
@@ -287,21 +323,14 @@ class Segment(Geometry2D):
 
     def _base_coords(self) -> np.ndarray:
         if self.line_type == 0 :
-            coord = np.zeros((self.nD, 2))
-
             d = -self.uS/2 + self.uS*np.arange(self.nD)/(self.nD-1)
 
-            coord[:, 0] = d * cos(self.aG)
-            coord[:, 1] = d * sin(self.aG)
-
-            return coord
+            # the direction is constant along the segment, so one outer product 
+            # fills both columns without an intermediate zero buffer
+            return np.multiply.outer(d, (cos(self.aG), sin(self.aG)))
         else :
-            d = np.arange(self.nD)
-            coord = np.zeros((self.nD, 2))
-            coord[:, 0] = (d * self.p2[0] + (self.nD - d - 1) * self.p1[0])/(self.nD-1)
-            coord[:, 1] = (d * self.p2[1] + (self.nD - d - 1) * self.p1[1])/(self.nD-1)
-
-            return coord
+            # both axes are interpolated in a single call, end-points kept exact
+            return np.linspace(self.p1, self.p2, self.nD, dtype=float)
         
     def _linear_paths(self) -> Tuple[list, list]:
         return [linear_seq(len(self))], []
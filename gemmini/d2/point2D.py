@@ -19,7 +19,7 @@ class PointSet2D(Geometry2D):
         if not hasattr(self, 'gem_type'):
             self.gem_type = 'PointSet2D'
 
-        self.points = np.array(points)
+        self.points = np.asarray(points, dtype=float)
         
         if len(self.points.shape) != 2 or self.points.shape[1] != 2 :
             raise ValueError(" \
@@ -62,8 +62,12 @@ class Point2D(PointSet2D):
         self.px = px
         self.py = py
 
+        # fill the single row directly, instead of parsing a nested list
+        points = np.empty((1, 2))
+        points[0, 0], points[0, 1] = px, py
+
         super().__init__(
-            points=[[px, py]],
+            points=points,
             planar=False,
             **kwargs
         )
@@ -96,20 +100,19 @@ class Pointcloud2D(PointSet2D):
         """
         self.h, self.w, self.nD = h, w, n
         
-        if isNumber(s) and s != -1:
-            self.h, self.w = map(float, [s]*2)
-        
-        if isNumberArray(s):
+        if isNumber(s):
+            if s != -1:
+                self.h = self.w = float(s)
+        elif isNumberArray(s):
             if len(s) != 2:
-                raise(" \
+                raise ValueError(" \
                     [ERROR] Pointcloud2D: Argument `size` must be either a single number or a pair of numbers. \
                 ")
                 
             self.h, self.w = s[0], s[1]
 
-        points = np.random.rand(self.nD, 2)
-        points[:, 0] *= self.w
-        points[:, 1] *= self.h
+        # scaled inside the generator; the global RNG is kept so `np.random.seed` still applies
+        points = np.random.uniform(0, (self.w, self.h), size=(self.nD, 2))
 
         super().__init__(
             points=points,
@@ -148,12 +151,12 @@ class Grid(PointSet2D):
         """
         self.h, self.w = h, w
         
-        if isNumber(s) and s != -1:
-            self.h, self.w = map(float, [s]*2)
-        
-        if isNumberArray(s):
+        if isNumber(s):
+            if s != -1:
+                self.h = self.w = float(s)
+        elif isNumberArray(s):
             if len(s) != 2:
-                raise(" \
+                raise ValueError(" \
                     [ERROR] Grid: Argument `size` must be either a single number or a pair of numbers. \
                 ")
                 
@@ -169,13 +172,12 @@ class Grid(PointSet2D):
                 [ERROR] Grid: Each row/column should consist of at least 2 dots. \
             ")
         
-        x, y = np.meshgrid(
-            np.linspace(-self.w/2, self.w/2, self.nc), 
-            np.linspace(-self.h/2, self.h/2, self.nr)
-        )
-
-        x, y = x.flatten(), y.flatten()
-        points = np.vstack((x, y)).T
+        # fill a single (row, column, xy) buffer by broadcasting the axis ticks,
+        # row-major order matches the former meshgrid/flatten layout
+        points = np.empty((self.nr, self.nc, 2))
+        points[:, :, 0] = np.linspace(-self.w/2, self.w/2, self.nc)
+        points[:, :, 1] = np.linspace(-self.h/2, self.h/2, self.nr)[:, None]
+        points = points.reshape(-1, 2)
 
         super().__init__(
             points=points,
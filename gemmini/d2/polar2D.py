@@ -1,8 +1,56 @@
+import functools
+
 from gemmini.misc import *
 from gemmini.d2._gem2D import Geometry2D
 from gemmini.calc.coords import to_cartesian
 
 
+def _cached_coords(func:Callable) -> Callable:
+    """
+    Memoize a coordinate builder on its shape parameters.
+
+    Geometries built with the same parameters share the resulting array, so 
+    it is returned read-only; `Geometry2D` keeps its own copy of the vertices.
+    """
+    @functools.lru_cache(maxsize=256)
+    @functools.wraps(func)
+    def wrapper(*args):
+        coord = func(*args)
+        coord.setflags(write=False)
+
+        return coord
+
+    return wrapper
+
+
+@functools.lru_cache(maxsize=64)
+def _periodic_theta(nD:int, turns:int = 1) -> np.ndarray:
+    """
+    Returns `nD` evenly spaced angles over `turns` full turns, end-point excluded.
+    The array is shared between callers, hence read-only.
+    """
+    theta = np.arange(nD)*(turns*2*np.pi/nD)
+    theta.setflags(write=False)
+
+    return theta
+
+
+@functools.lru_cache(maxsize=64)
+def _unit_circle(nD:int, turns:int = 1) -> np.ndarray:
+    """
+    Returns the (cos θ, sin θ) table for the angles of `_periodic_theta`, in shape of (nD, 2).
+    Curves sharing `nD` only rescale it, so no trigonometry is repeated. Read-only.
+    """
+    theta = _periodic_theta(nD, turns)
+
+    u = np.empty((nD, 2))
+    np.cos(theta, out=u[:, 0])
+    np.sin(theta, out=u[:, 1])
+    u.setflags(write=False)
+
+    return u
+
+
 class Curve2D(Geometry2D):
     def __init__(
         self,
@@ -21,7 +69,7 @@ class Curve2D(Geometry2D):
             self.gem_type = 'Curve2D'
         
         self.rD = r
-        self.v = points
+        self.v = points if points is None else np.asarray(points, dtype=float)
 
         if self.rD <= 0:
             raise ValueError(" \
@@ -49,6 +97,11 @@ class Curve2D(Geometry2D):
         return super().__hash__()
 
 
+@_cached_coords
+def _circle_coords(rD:float, nD:int) -> np.ndarray:
+    return rD*_unit_circle(nD)
+
+
 class Circle(Curve2D):
     @geminit({'radius':'r', 'num_dot':'n'})
     def __init__(
@@ -66,10 +119,7 @@ class Circle(Curve2D):
         """
         self.rD, self.nD = r, n
 
-        theta = np.linspace(0, 2*np.pi, self.nD+1)[:-1]
-        rad = self.rD*np.ones_like(theta)
-
-        coord = to_cartesian(rad, theta)
+        coord = _circle_coords(self.rD, self.nD)
 
         super().__init__(
             r=self.rD,
@@ -82,6 +132,13 @@ class Circle(Curve2D):
         return super().__hash__() + hash((self.gem_type, self.rD, self.nD))
     
     
+@_cached_coords
+def _arc_coords(rD:float, aG:float, nD:int) -> np.ndarray:
+    theta = np.linspace(0, aG, nD)
+
+    return to_cartesian(rD, theta)
+
+
 class Arc(Curve2D):
     @geminit({'radius':'r', 'angle':'a', 'num_dot':'n'})
     def __init__(
@@ -106,10 +163,7 @@ class Arc(Curve2D):
                 [ERROR] Arc: The argument `angle` must be in range (0, 2π]. \
             ")
 
-        theta = np.linspace(0, self.aG, self.nD)
-        rad = self.rD*np.ones_like(theta)
-
-        coord = to_cartesian(rad, theta)
+        coord = _arc_coords(self.rD, self.aG, self.nD)
 
         super().__init__(
             r=self.rD,
@@ -122,6 +176,14 @@ class Arc(Curve2D):
         return super().__hash__() + hash((self.gem_type, self.rD, self.nD, self.aG))
 
     
+@_cached_coords
+def _ellipse_coords(rH:float, rW:float, nD:int) -> np.ndarray:
+    coord = _unit_circle(nD)*(rW, rH)
+    coord /= 2
+
+    return coord
+
+
 class Ellipse(Curve2D):
     @geminit({'size':'s', 'height':'h', 'width':'w', 'num_dot':'n'})
     def __init__(
@@ -163,8 +225,7 @@ class Ellipse(Curve2D):
                 [ERROR] Ellipse: The length of axes should be longer than 0. \
             ")
 
-        theta = np.linspace(0, 2*np.pi, self.nD+1)[:-1]
-        coord = np.stack((self.rW*np.cos(theta), self.rH*np.sin(theta)), axis=1)/2
+        coord = _ellipse_coords(self.rH, self.rW, self.nD)
 
         super().__init__(
             r=max(self.rH, self.rW)/2,
@@ -245,12 +306,10 @@ def HyperbolicSpiral(
         n | num_dot (int): number of dots consisting of the spiral.
     """
     def _draw_curve(radius, theta):
-        aG = np.max(theta)
-        n = len(theta)
-        _x = np.array(list(range(1, n+1)))[::-1]
-        _theta = aG/_x
+        # theta is increasing, so its last sample is the maximum angle
+        _theta = theta[-1]/np.arange(len(theta), 0, -1)
         
-        rad = radius * _theta[0]/_theta
+        rad = (radius*_theta[0].item())/_theta
         coord = to_cartesian(rad, _theta)
 
         return coord
@@ -276,16 +335,19 @@ def ParabolicSpiral(
     """
     def _draw_curve(radius, theta):
         log_theta = np.sqrt(theta)
-        rad = radius * log_theta/log_theta[-1]
+        rad = radius * log_theta/log_theta[-1].item()
 
-        if len(log_theta)%2 == 0 :
-            coord_pos = to_cartesian(rad[::2], theta[::2])
-            coord_neg = to_cartesian(-rad[::2], theta[::2])
-        else :
-            coord_pos = to_cartesian(rad[1::2], theta[1::2])
-            coord_neg = to_cartesian(-rad[::2], theta[::2])
+        # the positive branch takes every other sample, ending at the second-to-last one
+        # (index n-2); the negative branch is the mirrored (negated) even samples, 
+        # which are the same samples when n is even.
+        k = len(theta)%2
+        coord_pos = to_cartesian(rad[k::2], theta[k::2])
+        coord_neg = coord_pos if k == 0 else to_cartesian(rad[::2], theta[::2])
 
-        coord = np.concatenate((np.flip(coord_pos, axis=0), coord_neg), axis=0)
+        m = len(coord_pos)
+        coord = np.empty((m + len(coord_neg), 2))
+        coord[:m] = coord_pos[::-1]
+        np.negative(coord_neg, out=coord[m:])
 
         return coord
 
@@ -310,7 +372,7 @@ def LituusSpiral(
     """
     def _draw_curve(radius, theta):
         log_theta = np.power(theta, -1/2)
-        rad = radius * log_theta[-1]/log_theta
+        rad = radius * log_theta[-1].item()/log_theta
 
         coord = to_cartesian(rad, theta)
 
@@ -335,14 +397,12 @@ def LogarithmicSpiral(
         n | num_dot (int): number of dots consisting of the spiral.
     """
     def _draw_curve(radius, theta):
-        aG = np.max(theta)
+        aG = theta[-1].item()
         n = len(theta)
-        _x = [log(i/n) for i in range(1, n+1)]
-        _x = np.array(_x)
-        _theta = _x + aG
+        _theta = np.log(np.arange(1, n+1)/n) + aG
         
         exp_theta = np.exp(_theta)
-        rad = radius * exp_theta/exp_theta[-1]
+        rad = radius * exp_theta/exp_theta[-1].item()
 
         coord = to_cartesian(rad, _theta)
 
@@ -368,7 +428,7 @@ def BoundedSpiral(
     """
     def _draw_curve(radius, theta):
         arc_theta = np.arctan(theta/(2*pi))
-        rad = radius * arc_theta/np.max(arc_theta)
+        rad = radius * arc_theta/arc_theta[-1].item()
 
         coord = to_cartesian(rad, theta)
 
@@ -377,6 +437,23 @@ def BoundedSpiral(
     return Spiral(r, a, n, draw_func=_draw_curve, gem_type='BoundedSpiral', **kwargs)
 
 
+@_cached_coords
+def _cycloid_coords(rD:float, aG:float, nD:int) -> np.ndarray:
+    theta = np.linspace(0, aG, nD)
+
+    # evaluate both columns in place, without per-term temporaries
+    coord = np.empty((nD, 2))
+    dx, dy = coord[:, 0], coord[:, 1]
+
+    np.subtract(theta, np.sin(theta, out=dx), out=dx)
+    np.subtract(1, np.cos(theta, out=dy), out=dy)
+    coord *= rD
+    coord /= theta[-1]
+    dx -= rD/2
+
+    return coord
+
+
 class Cycloid(Curve2D):
     @geminit({'radius':'r', 'angle':'a', 'num_dot':'n'})
     def __init__(
@@ -396,12 +473,7 @@ class Cycloid(Curve2D):
         """
         self.rD, self.aG, self.nD = r, a, n
 
-        theta = np.linspace(0, self.aG, self.nD)
-        dx = self.rD*(theta - np.sin(theta))
-        dy = self.rD*(1 - np.cos(theta))
-
-        coord = np.stack((dx, dy), axis=1)/np.max(theta)
-        coord[:, 0] -= self.rD/2
+        coord = _cycloid_coords(self.rD, self.aG, self.nD)
 
         super().__init__(
             r=self.rD,
@@ -414,6 +486,29 @@ class Cycloid(Curve2D):
         return super().__hash__() + hash((self.gem_type, self.rD, self.nD, self.aG))
 
     
+@_cached_coords
+def _epicycloid_coords(p:int, q:int, uS:float, nD:int) -> np.ndarray:
+    k = p/q
+    theta = _periodic_theta(nD, q)
+    u = _unit_circle(nD, q)
+
+    # fill the two columns in place, evaluating (k+1)θ only once
+    kt = (k+1)*theta
+    coord = np.empty((nD, 2))
+    
+    np.multiply(u[:, 0], k+1, out=coord[:, 0])
+    np.subtract(coord[:, 0], np.cos(kt), out=coord[:, 0])
+    np.multiply(u[:, 1], k+1, out=coord[:, 1])
+    np.subtract(coord[:, 1], np.sin(kt), out=coord[:, 1])
+
+    # normalize in place; the peak is taken before scaling, as before
+    m = np.max(coord)
+    coord *= uS/2
+    coord /= m
+
+    return coord
+
+
 class Epicycloid(Curve2D):
     @geminit({'size':'s', 'num_dot':'n'})
     def __init__(
@@ -441,13 +536,7 @@ class Epicycloid(Curve2D):
                 [ERROR] Epicycloid: Both `p` and `q` must be positive integers. \
             ")
 
-        k = self.p/self.q
-        theta = np.linspace(0, self.q*2*np.pi, self.nD+1)[:-1]
-
-        dx = (k+1)*np.cos(theta) - np.cos((k+1)*theta)
-        dy = (k+1)*np.sin(theta) - np.sin((k+1)*theta)
-        coord = np.stack((dx, dy), axis=1)
-        coord = self.uS/2 * coord / np.max(coord)
+        coord = _epicycloid_coords(self.p, self.q, self.uS, self.nD)
 
         super().__init__(
             r=self.uS/2,
@@ -460,6 +549,29 @@ class Epicycloid(Curve2D):
         return super().__hash__() + hash((self.gem_type, self.p, self.q, self.uS, self.nD))
     
 
+@_cached_coords
+def _hypocycloid_coords(p:int, q:int, uS:float, nD:int) -> np.ndarray:
+    k = p/q
+    theta = _periodic_theta(nD, q)
+    u = _unit_circle(nD, q)
+
+    # fill the two columns in place, evaluating (k-1)θ only once
+    kt = (k-1)*theta
+    coord = np.empty((nD, 2))
+    
+    np.multiply(u[:, 0], k-1, out=coord[:, 0])
+    np.add(coord[:, 0], np.cos(kt), out=coord[:, 0])
+    np.multiply(u[:, 1], k-1, out=coord[:, 1])
+    np.subtract(coord[:, 1], np.sin(kt), out=coord[:, 1])
+
+    # normalize in place; the peak is taken before scaling, as before
+    m = np.max(coord)
+    coord *= uS/2
+    coord /= m
+
+    return coord
+
+
 class Hypocycloid(Curve2D):
     @geminit({'size':'s', 'num_dot':'n'})
     def __init__(
@@ -487,13 +599,7 @@ class Hypocycloid(Curve2D):
                 [ERROR] Hypocycloid: Both `p` and `q` must be positive integers. \
             ")
         
-        k = self.p/self.q
-        theta = np.linspace(0, self.q*2*np.pi, self.nD+1)[:-1]
-
-        dx = (k-1)*np.cos(theta) + np.cos((k-1)*theta)
-        dy = (k-1)*np.sin(theta) - np.sin((k-1)*theta)
-        coord = np.stack((dx, dy), axis=1)
-        coord = self.uS/2 * coord / np.max(coord)
+        coord = _hypocycloid_coords(self.p, self.q, self.uS, self.nD)
 
         super().__init__(
             r=self.uS/2,
@@ -534,6 +640,22 @@ def CurvedPolygon(
     return Hypocycloid(v, 1, s, n, **kwargs)
 
 
+@_cached_coords
+def _lissajous_coords(a:float, b:float, uS:float, nD:int) -> np.ndarray:
+    theta = _periodic_theta(nD)
+    
+    # evaluate both columns in place, without per-term temporaries
+    coord = np.empty((nD, 2))
+    dx, dy = coord[:, 0], coord[:, 1]
+
+    np.cos(np.multiply(a, theta, out=dx), out=dx)
+    np.sin(np.multiply(b, theta, out=dy), out=dy)
+    coord *= uS
+    coord /= 2
+
+    return coord
+
+
 class Lissajous(Curve2D):
     @geminit({'size':'s', 'num_dot':'n'})
     def __init__(
@@ -555,12 +677,7 @@ class Lissajous(Curve2D):
         """
         self.a, self.b, self.uS, self.nD = a, b, s, n
 
-        theta = np.linspace(0, 2*np.pi, self.nD+1)[:-1]
-        
-        dx = self.uS*(np.cos(self.a*theta))/2
-        dy = self.uS*(np.sin(self.b*theta))/2
-
-        coord = np.stack((dx, dy), axis=1)
+        coord = _lissajous_coords(self.a, self.b, self.uS, self.nD)
 
         super().__init__(
             r=self.uS/2,
@@ -573,6 +690,17 @@ class Lissajous(Curve2D):
         return super().__hash__() + hash((self.gem_type, self.a, self.b, self.uS, self.nD))
     
     
+@_cached_coords
+def _folium_coords(rD:float, nD:int) -> np.ndarray:
+    u = _unit_circle(nD)
+    rad = rD*np.power(u[:, 0], 3)
+
+    coord = rad[:, None]*u
+    coord[:, 0] -= rD/2
+
+    return coord
+
+
 class Folium(Curve2D):
     @geminit({'radius':'r', 'num_dot':'n'})
     def __init__(
@@ -590,11 +718,7 @@ class Folium(Curve2D):
         """
         self.rD, self.nD = r, n
 
-        theta = np.linspace(0, 2*np.pi, self.nD+1)[:-1]
-        rad = self.rD*np.power(np.cos(theta), 3)
-
-        coord = to_cartesian(rad, theta)
-        coord[:, 0] -= self.rD/2
+        coord = _folium_coords(self.rD, self.nD)
 
         super().__init__(
             r=self.rD,
@@ -607,6 +731,14 @@ class Folium(Curve2D):
         return super().__hash__() + hash((self.gem_type, self.rD, self.nD))
     
     
+@_cached_coords
+def _bifolium_coords(rD:float, nD:int) -> np.ndarray:
+    u = _unit_circle(nD)
+    rad = rD*u[:, 1]*np.power(u[:, 0], 2)
+
+    return rad[:, None]*u
+
+
 class Bifolium(Curve2D):
     @geminit({'radius':'r', 'num_dot':'n'})
     def __init__(
@@ -624,10 +756,7 @@ class Bifolium(Curve2D):
         """
         self.rD, self.nD = r, n
 
-        theta = np.linspace(0, 2*np.pi, self.nD+1)[:-1]
-        rad = self.rD*np.sin(theta)*np.power(np.cos(theta), 2)
-
-        coord = to_cartesian(rad, theta)
+        coord = _bifolium_coords(self.rD, self.nD)
 
         super().__init__(
             r=self.rD,
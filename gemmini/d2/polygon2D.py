@@ -20,7 +20,7 @@ class Polygon2D(Geometry2D):
         if not hasattr(self, 'gem_type'):
             self.gem_type = 'Polygon2D'
         
-        self.v = vertices
+        self.v = np.asarray(vertices, dtype=float)
         
         super().__init__(
             planar=True,
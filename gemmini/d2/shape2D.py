@@ -48,9 +48,7 @@ class CircularSector(Geometry2D):
         naD = _nD - 2*nrD
 
         theta = np.linspace(0, min(2*pi, self.aG), naD)
-        rad = self.rD*np.ones_like(theta)
-
-        coord_arc = to_cartesian(rad, theta)
+        coord_arc = to_cartesian(self.rD, theta)
         
         r1 = Segment(p1=(0,0), p2=(coord_arc[0][0], coord_arc[0][1]), n=nrD)
         r2 = Segment(p1=(coord_arc[-1][0], coord_arc[-1][1]), p2=(0, 0), n=nrD)
@@ -114,9 +112,7 @@ class CircularSegment(Geometry2D):
         ncD = _nD - naD
 
         theta = np.linspace(0, min(2*pi, self.aG), naD)
-        rad = self.rD*np.ones_like(theta)
-
-        coord_arc = to_cartesian(rad, theta)
+        coord_arc = to_cartesian(self.rD, theta)
 
         c = Segment(p1=(coord_arc[-1][0], coord_arc[-1][1]), p2=(coord_arc[0][0], coord_arc[0][1]), n=ncD)
         
@@ -222,8 +218,7 @@ class Helix(Geometry2D):
     def _base_coords(self) -> np.ndarray:
         theta = np.linspace(0, self.aG, self.nD)
         height = self.pitch*np.linspace(-self.rD, self.rD, self.nD)
-        rad = self.rD*np.ones_like(theta)
-        coord = np.stack((rad*np.cos(theta), -rad*np.sin(theta) + height), axis=1)
+        coord = np.stack((self.rD*np.cos(theta), -self.rD*np.sin(theta) + height), axis=1)
 
         return coord
     
@@ -482,7 +477,7 @@ class Heart(Geometry2D):
         )
 
     def _base_coords(self) -> np.ndarray:
-        theta = np.linspace(0, 2*np.pi, self.nD+1)[:-1]
+        theta = np.arange(self.nD)*(2*np.pi/self.nD)
         rad = (self.uS/2)*(2 - 2.3*np.sin(theta) + 0.4*np.cos(2*theta)
             + (1.3*np.sin(theta) * np.sqrt(np.power(np.abs(np.cos(theta)), 1.3)))/(np.sin(theta) + 1.7))/3
 
@@ -524,7 +519,7 @@ class ButterFly(Geometry2D):
         )
 
     def _base_coords(self) -> np.ndarray:
-        theta = np.linspace(0, 2*np.pi, self.nD+1)[:-1]
+        theta = np.arange(self.nD)*(2*np.pi/self.nD)
         rad = self.uS*(1.35 - np.cos(theta - np.pi/3) * np.sin(3*(theta - np.pi/3)))/2
 
         leftside = np.where(
@@ -612,7 +607,7 @@ class Boomerang(Geometry2D):
         )
         
     def _base_coords(self) -> np.ndarray:
-        theta = np.linspace(0, 2*np.pi, self.nD+1)[:-1]
+        theta = np.arange(self.nD)*(2*np.pi/self.nD)
         rx = (np.cos(theta) + np.cos(2*theta))/4
         ry = np.sin(theta)
         
@@ -660,7 +655,7 @@ class Stellate(Geometry2D):
         )
 
     def _base_coords(self) -> np.ndarray:
-        theta = np.linspace(0, 2*np.pi, self.nD+1)[:-1]
+        theta = np.arange(self.nD)*(2*np.pi/self.nD)
         rx = (9 + np.cos(self.nC*theta))*np.sin(theta)/10
         ry = (9 + np.cos(self.nC*theta))*np.cos(theta)/10
         
@@ -840,7 +835,7 @@ def Flower_B(s:float = None, n:int = 128, nL:int = 6, **kwargs) -> _Flower:
         nL | num_leaves (int): number of floral leaves.
     """
     def func(uS, nD, nL):
-        theta = np.linspace(0, 2*np.pi, nD+1)[:-1]
+        theta = np.arange(nD)*(2*np.pi/nD)
         rad = uS*(2 - np.power(np.sin(nL*theta), 3))/3
         coord = to_cartesian(rad, theta)
         
@@ -865,7 +860,7 @@ def Flower_C(s:float = None, n:int = 128, nL:int = 5, **kwargs) -> _Flower:
         ")
     
     def func(uS, nD, nL):
-        theta = np.linspace(0, 4*np.pi, nD+1)[:-1]
+        theta = np.arange(nD)*(4*np.pi/nD)
         rad = uS * (2 + np.cos(nL*theta/2))/3
             
         coord = to_cartesian(rad, theta)
@@ -887,9 +882,11 @@ def Flower_D(s:float = None, n:int = 25, nL:int = 6, **kwargs) -> _Flower:
     """
     def func(uS, nD, nL):
         if nD%2 == 0 :
-            theta = np.linspace(0, 4*np.pi, 12*(nD+1)+1)[:-1]
+            nT = 12*(nD+1)
         else :
-            theta = np.linspace(0, 4*np.pi, 24*(nD//2 + 1)+1)[:-1]
+            nT = 24*(nD//2 + 1)
+
+        theta = np.arange(nT)*(4*np.pi/nT)
             
         rad = uS * np.cos(3*theta/2)
         coord = to_cartesian(rad, theta)
@@ -917,7 +914,7 @@ def Flower_E(s:float = None, n:int = 128, nL:int = 6, **kwargs) -> _Flower:
         nL | num_leaves (int): number of floral leaves.
     """
     def func(uS, nD, nL):
-        theta = np.linspace(0, 2*np.pi, nD+1)[:-1]
+        theta = np.arange(nD)*(2*np.pi/nD)
         rx = 2*np.cos(2*theta) + np.cos((1 + nL)*theta)
         ry = 2*np.sin(2*theta) + np.sin((1 + nL)*theta)
         
@@ -939,7 +936,7 @@ def Flower_F(s:float = None, n:int = 128, nL:int = 6, **kwargs) -> _Flower:
         nL | num_leaves (int): number of floral leaves.
     """
     def func(uS, nD, nL):
-        theta = np.linspace(0, 2*np.pi, nD+1)[:-1]
+        theta = np.arange(nD)*(2*np.pi/nD)
         rad = uS*(1 + np.cos(nL*theta))/2
         
         coord = to_cartesian(rad, theta)
@@ -979,7 +976,7 @@ class Clover(Geometry2D):
         )
         
     def _base_coords(self) -> np.ndarray:
-        theta = np.linspace(0, 2*np.pi, self.nD+1)[:-1]
+        theta = np.arange(self.nD)*(2*np.pi/self.nD)
         rad = 1 + np.cos(self.nV*theta) + np.power(np.sin(self.nV*theta), 2)
         rad = (self.uS/2)*rad/3
         
@@ -1026,7 +1023,7 @@ class FattyStar(Geometry2D):
         )
         
     def _base_coords(self) -> np.ndarray:
-        theta = np.linspace(0, 2*np.pi, self.nD+1)[:-1]
+        theta = np.arange(self.nD)*(2*np.pi/self.nD)
         rad = (self.uS/2)*(1.5 - np.power(np.sin(self.nV*theta/2)/2 + np.cos(self.nV*theta/2)/2, 2))
         
         coord = to_cartesian(rad, theta)
@@ -1074,10 +1071,8 @@ class Moon(Geometry2D):
         )
 
     def _base_coords(self) -> np.ndarray:
-        theta = np.linspace(0, 2*np.pi, self.nD+1)[:-1]
-        rad = self.rD*np.ones_like(theta)/2
-
-        coord = to_cartesian(rad, theta)
+        theta = np.arange(self.nD)*(2*np.pi/self.nD)
+        coord = to_cartesian(self.rD/2, theta)
         fliped_idx = np.where(coord[:, 0] <= -self.bR*self.rD/2)
         coord[fliped_idx, 0] = -self.bR*self.rD - coord[fliped_idx, 0]
 
@@ -1591,10 +1586,10 @@ class Plaque(Geometry2D):
         )
         
     def _base_coords(self) -> np.ndarray:
-        theta = np.linspace(0, 2*np.pi, self.nD+1)[:-1]
+        theta = np.arange(self.nD)*(2*np.pi/self.nD)
         rad = 1/np.abs(np.sin(2*theta) + 1e-6)
         rad = np.power(rad, 0.5)
-        rad = self.uS * np.minimum(rad/(2 - self.bR), np.ones_like(theta))/2
+        rad = self.uS * np.minimum(rad/(2 - self.bR), 1)/2
         
         coord = to_cartesian(rad, theta)
 
@@ -1728,11 +1723,8 @@ class BlockArc(Geometry2D):
         theta_major = np.linspace(0, self.aG, nD_major+2)[1:-1]
         theta_minor = np.linspace(0, self.aG, nD_minor+2)[1:-1]
         
-        rad_major = self.R*np.ones_like(theta_major)
-        rad_minor = self.r*np.ones_like(theta_minor)
-        
-        coord_R = to_cartesian(rad_major, theta_major)
-        coord_r = to_cartesian(rad_minor, theta_minor)[::-1]
+        coord_R = to_cartesian(self.R, theta_major)
+        coord_r = to_cartesian(self.r, theta_minor)[::-1]
         coord_e1 = Segment(
             p1=(self.r, 0), 
             p2=(self.R, 0),
@@ -1859,10 +1851,10 @@ class Cross_B(Geometry2D):
         )
         
     def _base_coords(self) -> np.ndarray:
-        theta = np.linspace(0, 2*np.pi, self.nD+1)[:-1]
+        theta = np.arange(self.nD)*(2*np.pi/self.nD)
         rad = 1/np.abs(np.sin(2*theta) + 1e-6)
         rad = np.power(rad, 2.5)
-        rad = self.uS * np.minimum(rad/(2 - self.bR), np.ones_like(theta))/2
+        rad = self.uS * np.minimum(rad/(2 - self.bR), 1)/2
         
         coord = to_cartesian(rad, theta)
 
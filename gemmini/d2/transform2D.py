@@ -424,6 +424,21 @@ def dot(xy:COORDINATES, m:np.ndarray) -> np.ndarray:
 
     return _c @ m
 
+def affine_matrix(a:float, b:float, c:float, d:float, tx:float = 0, ty:float = 0) -> np.ndarray:
+    """
+    Build the 3 x 3 homogeneous matrix of the map x' = a*x + b*y + tx, y' = c*x + d*y + ty.
+
+    Args:
+        a, b, c, d (float): entries of the linear part [[a, b], [c, d]].
+        tx (float): shift along x-axis.
+        ty (float): shift along y-axis.
+    """
+    return np.array([
+        [a, b, tx],
+        [c, d, ty],
+        [0, 0, 1]
+    ], dtype=float)
+
 def distort(xy:COORDINATES, method='barrel', rate:float = 0.5) -> np.ndarray:
     """
     Distorts a point set using various distorting methods.
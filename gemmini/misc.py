@@ -1,6 +1,7 @@
 import inspect
 import warnings
 import itertools
+import functools
 
 import numpy as np
 from typing import Callable, Any, List, Optional, Tuple, Union
@@ -92,9 +93,29 @@ def isSame(a:object, b:object, bound=1e-6) -> bool:
     return False
 
 
-def inspect_args(func, aliases, error_tag, *args, **kwargs):
+@functools.lru_cache(maxsize=None)
+def _arg_table(func) -> Tuple[list, list]:
+    """
+    Returns the positional argument names of `func` (without `self`) and their defaults,
+    `None` standing for a missing default. Signatures never change, so the table 
+    is built once per function instead of on every call.
+    """
     spec = inspect.getfullargspec(func)
 
+    arg_names = spec.args[1:] if spec.args[0] == 'self' else spec.args
+
+    defaults = [None]*len(arg_names)
+
+    if spec.defaults is not None:
+        for i, v in enumerate(spec.defaults):
+            defaults[i + len(arg_names) - len(spec.defaults)] = v
+
+    return arg_names, defaults
+
+
+def inspect_args(func, aliases, error_tag, *args, **kwargs):
+    arg_names, defaults = _arg_table(func)
+
     for name, alias in aliases.items():
         if alias in kwargs:
             continue
@@ -103,14 +124,6 @@ def inspect_args(func, aliases, error_tag, *args, **kwargs):
             kwargs[alias] = kwargs[name]
             continue
 
-    arg_names = spec.args[1:] if spec.args[0] == 'self' else spec.args
-
-    defaults = [None]*len(arg_names)
-
-    if type(spec.defaults) != type(None):
-        for i, v in enumerate(spec.defaults):
-            defaults[i + len(arg_names) - len(spec.defaults)] = v
-
     for i, v in enumerate(defaults):
         arg = arg_names[i]
 
@@ -121,7 +134,7 @@ def inspect_args(func, aliases, error_tag, *args, **kwargs):
             kwargs[arg] = args[i]
             continue
 
-        if type(v) != type(None):
+        if v is not None:
             kwargs[arg] = v
             continue
 
@@ -156,33 +169,6 @@ def geminit(aliases={}):
     return decorator
 
 
-def _convert_tuple(a):
-    if isinstance(a, list):
-        if isinstance(a[0], list):
-            return tuple(itertools.chain(*a))
-        
-        return tuple(a)
-    
-    if isinstance(a, np.ndarray):
-        if len(a.shape) != 1:
-            return tuple(a.flatten().tolist())
-        
-        return tuple(a.tolist())
-
-    return a
-
-def get_hash(*args, **kwargs):
-    base = []
-    
-    for arg in args:
-        base.append(_convert_tuple(arg))
-        
-    for k, v in kwargs.items():
-        _v = _convert_tuple(v)
-        base.append((k, _v))
-        
-    return hash(tuple(base))
-
 def assignArg(gem_type:str, list_abbrs:List[Any], list_full_names:List[str], kwargs):
     res = []
     
@@ -205,19 +191,19 @@ def assignArg(gem_type:str, list_abbrs:List[Any], list_full_names:List[str], kwa
         elif isinstance(full_name, str) and full_name in kwargs:
             arg_name = full_name
 
-        if type(abbr) != type(None) and arg_name != '':
+        if abbr is not None and arg_name != '':
             raise ValueError(" \
                 [ERROR] %s: same flag used two times. \
                 "%(gem_type)
             )
         
-        if type(abbr) == type(None) and arg_name == '':
+        if abbr is None and arg_name == '':
             raise ValueError("\
                 [ERROR] %s: '%s' argument was not given. \
                 "%(gem_type, full_name if type(full_name) == str else full_name[0])
             )
         
-        v = abbr if type(abbr) != type(None) else kwargs[arg_name]
+        v = abbr if abbr is not None else kwargs[arg_name]
         res.append(v)
     
     if len(res) == 1:
@@ -3,6 +3,181 @@ from gemmini.canvas import plot
 from gemmini.d2.point2D import PointSet2D
 from gemmini.d2.polygon2D import ConcaveStar
 from gemmini.d2._gem2D import *
+from gemmini.d2 import batch_transform
+from gemmini.d2.polar2D import Circle
+from gemmini.d2.shape2D import Star
+from gemmini.d2 import transform2D as T
+
+import pytest
+
+def _recomputed_bbox(f):
+    c = f.coords()
+    return c[:, 0].min(), c[:, 1].min(), c[:, 0].max(), c[:, 1].max()
+
+def test_gem2D_cached_bbox():
+    f = Circle(r=3)
+    f.bounding_box()
+
+    f.scale(3)
+    f.translate(.1, .1)
+    f.scale(7)
+    f.translateX(.3)
+    f.flipX()
+    f.scaleY(1.1)
+
+    assert f.bounding_box() == _recomputed_bbox(f)
+
+    f.translate(-.7, .3)
+    f.flipY()
+
+    assert f.bounding_box() == _recomputed_bbox(f)
+
+_OPS = [
+    ('scale', (1.5,)), ('scale', (2, 3)), ('scaleX', (3,)), ('scaleY', (2.5,)),
+    ('translate', (5, -25)), ('translateX', (5,)), ('translateY', (25,)),
+    ('rotate', (pi/6,)), ('rotateX', (pi/6,)), ('rotateY', (pi/6,)), ('rotateZ', (pi/6,)),
+    ('rotate3D', (pi/6, pi/3, -pi/4)), ('skew', (pi/6,)), ('skewX', (pi/3,)), ('skewY', (pi/3,)),
+    ('flip', ((-15, 10),)), ('flipX', ()), ('flipY', ()), ('flipXY', ()), ('flipDiagonal', ()),
+    ('dot', (np.array([[1, 0.5], [-0.5, -2]]),)),
+    ('distort', ('barrel', 0.5)), ('focus', ((25, 25), 2)), ('shatter', ((25, 25), 0.5)),
+]
+
+def _recomputed(f):
+    g = f.copy()
+    g._cache.clear()
+    return g.bounding_box(), g.center(), g.area()
+
+def test_gem2D_lazy_chain():
+    f = Star(s=10)
+    eager = f.coords().copy()
+
+    for op, args in _OPS:
+        getattr(f, op)(*args)
+        eager = getattr(T, op)(eager, *args)
+
+    assert np.allclose(f.coords(), eager, rtol=1e-9, atol=1e-9)
+
+@pytest.mark.parametrize('op, args', _OPS)
+def test_gem2D_caches(op, args):
+    f = Star(s=10)
+    f.translate(3, -2)
+
+    f.bounding_box()
+    f.center()
+    f.area()
+
+    getattr(f, op)(*args)
+    getattr(f, 'translate')(.1, .3)
+
+    assert (f.bounding_box(), f.center(), f.area()) == _recomputed(f)
+
+def test_gem2D_apply_affine():
+    f = Star(s=10)
+    g = f.copy()
+
+    m = np.array([[1, 0.5, 3], [-0.5, 2, -1]])
+    f.apply_affine(m)
+    g.dot(m[:, :2].T)
+    g.translate(3, -1)
+
+    assert np.allclose(f.coords(), g.coords())
+
+    # the matrix is copied, so editing it afterwards leaves the geometry as it is
+    h = Star(s=10)
+    h.apply_affine(m)
+    m[0, 2] = 100
+
+    assert np.array_equal(h.coords(), f.coords())
+
+    with pytest.raises(ValueError):
+        f.apply_affine(np.eye(2))
+
+    with pytest.raises(ValueError):
+        f.apply_affine([[1, 0, 0], [0, 1, 0], [1, 0, 1]])
+
+def test_gem2D_apply():
+    f = Star(s=10)
+    g = f.copy()
+
+    f.apply('rotate', angle=pi/6)
+    f.apply('scaleX', scale=2)
+    f.apply('translate', 1, -2)
+    f.apply('skew', ax=pi/9)
+    f.apply('distort', rate=0.3)
+
+    g.rotate(pi/6)
+    g.scaleX(2)
+    g.translate(1, -2)
+    g.skew(ax=pi/9)
+    g.distort(rate=0.3)
+
+    assert np.array_equal(f.coords(), g.coords())
+
+    with pytest.raises(ValueError):
+        f.apply('rotate')
+
+    with pytest.raises(ValueError):
+        f.apply('translate', 1)
+
+    with pytest.raises(ValueError):
+        f.apply('area')
+
+def test_gem2D_path_coords():
+    f = Star(s=10)
+    f.rotate(pi/5)
+
+    ext, inn = f.exterior_coords(), f.interior_coords()
+    ext_seq, inn_seq = f.exterior(), f.interior()
+
+    assert len(ext) == len(ext_seq) and len(inn) == len(inn_seq) > 0
+
+    for a, b in zip(ext + inn, ext_seq + inn_seq):
+        assert np.array_equal(a, b.points)
+
+def test_batch_transform():
+    figs = [Star(s=10), Circle(r=3), Circle(r=3, n=16), Star(s=10), Circle(r=3, n=256)]
+    figs[1].bounding_box()
+    refs = [f.copy() for f in figs]
+
+    for op, args in [('rotate', (pi/6,)), ('scale', (2, 3)), ('translate', (1, -2)), ('flipX', ())]:
+        batch_transform(figs, op, *args)
+
+        for f in refs:
+            getattr(f, op)(*args)
+
+        for f, g in zip(figs, refs):
+            assert np.array_equal(f.coords(), g.coords())
+            assert f.bounding_box() == _recomputed(f)[0]
+
+    m = np.array([[1, 0.5, 3], [-0.5, 2, -1]])
+    batch_transform(figs, m)
+
+    for f, g in zip(figs, refs):
+        g.apply_affine(m)
+        assert np.array_equal(f.coords(), g.coords())
+
+    with pytest.raises(ValueError):
+        batch_transform(figs, 'area')
+
+def test_gem2D_eq_hash():
+    fa = Circle(r=3)
+    fb = Circle(r=3)
+    fa.bounding_box()
+    fa.center()
+
+    for f in (fa, fb):
+        f.rotate(pi/7)
+        f.scale(3)
+        f.translate(.1, -.2)
+        f.skewX(pi/9)
+
+    assert np.array_equal(fa.coords(), fb.coords())
+    assert fa == fb
+    assert hash(fa) == hash(fb)
+
+    fb.translateX(1e-9)
+
+    assert fa != fb
 
 if __name__ == "__main__":
     nx, ny = (20, 20)
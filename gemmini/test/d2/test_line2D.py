@@ -1,7 +1,10 @@
 from gemmini.misc import *
 from gemmini.canvas import Canvas
 from gemmini.d2.line2D import *
-from gemmini.d2.polygon2D import RegularPolygon
+from gemmini.d2.polygon2D import RegularPolygon, Polygon2D
+from gemmini.d2.point2D import PointSet2D
+from gemmini.d2.polar2D import Bifolium
+from gemmini.d2.shape2D import *
 
 import pytest
 
@@ -25,6 +28,20 @@ def test_line2D_2():
     assert not a.parallel(c)
     assert c.orthog(e)
 
+def test_line2D_orthog_point():
+    a = Line2D((0, 1), slope=0)
+    b = Line2D((2, 0), (2, 5))
+    c = Line2D((0, 0), slope=1)
+
+    assert a.orthog_point((3, 4)) == (3, 1)
+    assert b.orthog_point((-1, 7)) == (2, 7)
+
+    x, y = c.orthog_point((2, 0))
+    assert (abs(x - 1) <= 1e-6 and abs(y - 1) <= 1e-6)
+
+    feet = c.orthog_points([(2, 0), (0, 2), (3, 3)])
+    assert np.allclose(feet, [(1, 1), (1, 1), (3, 3)])
+
 def test_line2D_3():
     canva = Canvas()
 
@@ -89,6 +106,49 @@ def test_line_with_gem():
     canva.add(gb)
     canva.plot()
 
+def test_line_with_gem_edges():
+    # crossings lying exactly on axis-aligned edges or shared vertices
+    cases = [
+        (SnippedRect(s=3), (0.1, 0.2), (1.3, -0.7), [(-1.5, 1.4), (1.5, -0.85)]),
+        (SnippedRect(s=3), (0.3, 0.8), (0.3, -1.3), [(0.3, -1.5), (0.3, 1.5)]),
+        (Arrow(s=3), (0.9, 0.4), (-0.5, 0.6), [(-1.5, 0.7429), (1.0818, 0.374)]),
+        (ArrowPentagon(s=3), (0.4, 0.3), (0.0, 0.5), [(-1.5, 1.25), (1.3207, -0.1604)]),
+        (CelticCross(s=3), (0.0, -0.3), (-0.8, -0.3), [
+            (-1.0669, -0.3), (-0.6331, -0.3), (-0.4029, -0.3), (-0.2143, -0.3), 
+            (0.2143, -0.3), (0.6331, -0.3), (0.8571, -0.3), (1.0636, -0.3)
+        ]),
+        (CircularSegment(r=3), (0.2, -0.5), (0.2, 0.8), [(0.2, 0.0), (0.2, 2.9898)]),
+        (Lshape(s=3, w=1), (-0.7, 0.9), (-0.1, 0.7), [(-1.0, 1.0), (0.0, 0.6667)]),
+        (RoundedRect(s=3), (1.2, 0.4), (-0.9, -1.5), [(-0.9, -1.5), (1.5, 0.6714)]),
+        (Star(s=3), (-0.2, 0.9), (0, 0), [
+            (-0.3959, 1.7815), (-0.206, 0.9271), (0.2192, -0.9866), (0.3037, -1.3665)
+        ]),
+        (Helix(s=3, r=1), (0.9, 0), (-1.8, 0.6), [
+            (-0.996, 0.4213), (-0.6862, 0.3525), (0.995, -0.0211), (1.0, -0.0222)
+        ]),
+        (Bifolium(r=3), (0.8, 0.4), (0.9, -0.3), [(0.75, 0.75), (0.8164, 0.2852)]),
+    ]
+
+    for gem, p1, p2, expected in cases:
+        res = np.unique(np.round(Line2D(p1, p2).intersect(gem), 4), axis=0)
+
+        assert res.shape == (len(expected), 2), gem.gem_type
+        assert np.allclose(res, expected, atol=1e-4), gem.gem_type
+
+    # repeated vertices give zero-length edges, which must not count as parallel
+    gems = [
+        Polygon2D(vertices=[(0, 0), (1, 0), (1, 1), (0, 0)]), 
+        PointSet2D([(0, 0), (0, 0), (1, 1)])
+    ]
+
+    for gem in gems:
+        a = Line2D((100, 100), (101, 103))
+        assert not a.on(gem)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            assert len(a.intersect(gem)) == 0
+
 def test_line_with_segment():
     canva = Canvas()
     a = Line2D((1, 0), slope=1/2)
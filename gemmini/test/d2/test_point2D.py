@@ -21,6 +21,20 @@ def test_point():
     canva.add(pc)
     canva.plot()
 
+def test_pointcloud():
+    np.random.seed(0)
+    a = Pointcloud2D(s=(4, 2), n=20)
+    np.random.seed(0)
+    b = Pointcloud2D(h=4, w=2, n=20)
+
+    assert np.array_equal(a.coords(), b.coords())
+    
+    mx, my, Mx, My = a.bounding_box()
+    assert 0 <= mx and Mx <= 2 and 0 <= my and My <= 4
+
+    with pytest.raises(ValueError):
+        Pointcloud2D(s=(4, 2, 1))
+
 def test_grid():
     canva = Canvas()
     g = Grid((5, 4), num_dot=(10, 8))
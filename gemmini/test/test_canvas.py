@@ -60,6 +60,43 @@ def test_canvas_4():
     canva.add(c, show_size=True)
     canva.plot()
 
+def test_canvas_index():
+    canva = Canvas()
+    
+    a = Line2D((10,0), (0,15))
+    b = RegularPolygon(s=3, v=6)
+    
+    canva.add((a, b))
+    
+    assert len(canva) == 2
+    assert canva[0] == b
+    assert canva[-1] == a
+    
+    c = Point2D(px=1, py=2)
+    canva.add(c)
+
+    assert [canva[i] for i in range(3)] == [b, c, a]
+    assert canva[-2] is c
+
+    with pytest.raises(IndexError):
+        canva[3]
+        
+    with pytest.raises(IndexError):
+        canva[-4]
+
+def test_canvas_remove():
+    canva = Canvas()
+    
+    a = Circle(r=3)
+    b = Circle(r=3)
+    
+    canva.add(a)
+    canva.add(b)
+    canva.remove(b)
+    
+    assert len(canva) == 1
+    assert canva[0] is a
+
 
 if __name__ == "__main__":
     test_canvas_1()